@@ -1,21 +1,74 @@
+import asyncio
 import re
+import threading
+import time
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
-from urllib.parse import urljoin
 import logging
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 try:
-    from bs4 import BeautifulSoup
+    from lxml import etree, html
 except ImportError:
-    raise ImportError("beautifulsoup4 is required. Install with: pip install beautifulsoup4")
+    raise ImportError("lxml is required. Install with: pip install lxml")
 
+# alpen-paesse.ch serves UTF-8, so the parser does not need to detect it
+_HTML_PARSER = html.HTMLParser(encoding='utf-8')
+# Pass links point to the individual pass pages
+_PASS_LINKS = etree.XPath('//a[contains(@href, "/alpenpaesse/")]')
+# All text nodes below an element, as plain strings
+_TEXT_NODES = etree.XPath('.//text()', smart_strings=False)
+# Innermost ancestor of a pass link (below <body>) holding a temperature plus
+# a status or update note. The text predicates are evaluated in C and stop at
+# the first matching text node instead of joining the whole subtree.
+_SECTION_KEYWORDS = ('open', 'offen', 'updated', 'aktualisiert')
+_LOWER_TEXT = 'translate(., "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")'
+_PASS_SECTION = etree.XPath(
+    'ancestor::*[ancestor::body][.//text()[contains(., "°C")]][.//text()[{}]][1]'.format(
+        ' or '.join(f'contains({_LOWER_TEXT}, "{keyword}")' for keyword in _SECTION_KEYWORDS)
+    )
+)
 
-@dataclass
+# Pattern matches temperatures like "-5°C", "12°C", "5.5°C"
+_TEMP_RE = re.compile(r'(-?\d+(?:\.\d+)?)°C')
+# Alternative pattern for temperatures without °C
+_TEMP_RE_FALLBACK = re.compile(r'(-?\d+(?:\.\d+)?)\s*°?C?')
+# Patterns for dates like "07.07.2025, 07:16" or "Updated on: 07.07.2025, 07:16";
+# they are searched on the joined section text, so the separators must not
+# match the line break between two text nodes
+_DATE_RES = [re.compile(p) for p in (
+    r'(\d{1,2}\.\d{1,2}\.\d{4},?[ \t]+\d{1,2}:\d{2})',
+    r'Updated on:[ \t]*(\d{1,2}\.\d{1,2}\.\d{4},?[ \t]+\d{1,2}:\d{2})',
+    r'Aktualisiert am:[ \t]*(\d{1,2}\.\d{1,2}\.\d{4},?[ \t]+\d{1,2}:\d{2})',
+)]
+# Line-anchored keyword scans over the newline-joined text of a pass section;
+# each line is one text node with its whitespace collapsed
+_ROUTE_RE = re.compile(r'^(?=.* - ).{1,99}$', re.MULTILINE)
+_STATUS_RE = re.compile(
+    r'^.*(?:open|offen|closed|gesperrt|befahrbar|restriction).*$',
+    re.MULTILINE | re.IGNORECASE,
+)
+_NOTES_RE = re.compile(
+    r'^.*(?:winter|snow|chain|restriction|obligatory|'
+    r'schnee|ketten|einschränkung|obligatorisch).*$',
+    re.MULTILINE | re.IGNORECASE,
+)
+# Keywords used to classify a pass status
+_OPEN_RE = re.compile(r'open|offen|befahrbar', re.IGNORECASE)
+_RESTRICTION_RE = re.compile(
+    r'restriction|chain|winter|snow|closed|einschränkung|ketten|schnee|gesperrt',
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True)
 class AlpinePass:
     """
     Represents a Swiss Alpine Pass with current status and conditions.
@@ -46,20 +99,11 @@ class AlpinePass:
     
     def is_open(self) -> bool:
         """Check if the pass is currently open."""
-        if not self.status:
-            return False
-        status_lower = self.status.lower()
-        return any(keyword in status_lower for keyword in ['open', 'offen', 'befahrbar'])
+        return bool(self.status) and _OPEN_RE.search(self.status) is not None
     
     def has_restrictions(self) -> bool:
         """Check if the pass has any restrictions."""
-        if not self.status:
-            return False
-        status_lower = self.status.lower()
-        return any(keyword in status_lower for keyword in [
-            'restriction', 'chain', 'winter', 'snow', 'closed',
-            'einschränkung', 'ketten', 'winter', 'schnee', 'gesperrt'
-        ])
+        return bool(self.status) and _RESTRICTION_RE.search(self.status) is not None
 
 
 class AlpenPasseScraper:
@@ -70,6 +114,17 @@ class AlpenPasseScraper:
     BASE_URL = "https://alpen-paesse.ch"
     MAIN_PAGE_DE = f"{BASE_URL}/de/"
     MAIN_PAGE_EN = f"{BASE_URL}/en/"
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+    # Seconds the passes parsed from the main page are reused
+    CACHE_TTL = 30
     
     def __init__(self, language: str = "en", timeout: int = 10):
         """
@@ -81,21 +136,34 @@ class AlpenPasseScraper:
         """
         self.language = language.lower()
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        # Created on first synchronous request; the async methods use the
+        # aiohttp session passed in by the caller
+        self._session: Optional[requests.Session] = None
         
         if self.language not in ["en", "de"]:
             raise ValueError("Language must be 'en' or 'de'")
             
         self.main_url = self.MAIN_PAGE_EN if language == "en" else self.MAIN_PAGE_DE
+        self._cached_passes: Optional[Tuple[float, List[AlpinePass]]] = None
+        # Serialize main page fetches so concurrent callers share one result
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Return the session used for synchronous requests, creating it on first use."""
+        if self._session is None:
+            session = requests.Session()
+            session.headers.update(self.HEADERS)
+            # Keep connections to the site alive across updates and retry
+            # transient failures instead of dropping the whole update
+            session.mount("https://", HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ))
+            self._session = session
+        return self._session
     
     def _make_request(self, url: str) -> Optional[requests.Response]:
         """
@@ -115,6 +183,29 @@ class AlpenPasseScraper:
             logger.error(f"Request failed for {url}: {e}")
             return None
     
+    async def _async_make_request(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """
+        Make an asynchronous HTTP request with error handling.
+        
+        Args:
+            session (aiohttp.ClientSession): Session to send the request with
+            url (str): URL to request
+            
+        Returns:
+            Optional[bytes]: Response body or None if failed
+        """
+        try:
+            async with session.get(
+                url,
+                headers=self.HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
+                response.raise_for_status()
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Request failed for {url}: {e}")
+            return None
+    
     def _extract_temperature(self, text: str) -> Optional[float]:
         """
         Extract temperature from text using regex.
@@ -128,9 +219,7 @@ class AlpenPasseScraper:
         if not text:
             return None
             
-        # Pattern matches temperatures like "-5°C", "12°C", "5.5°C"
-        temp_pattern = r'(-?\d+(?:\.\d+)?)°C'
-        match = re.search(temp_pattern, text)
+        match = _TEMP_RE.search(text)
         
         if match:
             try:
@@ -138,9 +227,7 @@ class AlpenPasseScraper:
             except ValueError:
                 pass
         
-        # Alternative pattern for temperatures without °C
-        temp_pattern2 = r'(-?\d+(?:\.\d+)?)\s*°?C?'
-        match = re.search(temp_pattern2, text)
+        match = _TEMP_RE_FALLBACK.search(text)
         if match:
             try:
                 return float(match.group(1))
@@ -162,145 +249,135 @@ class AlpenPasseScraper:
         if not text:
             return None
             
-        # Pattern for dates like "07.07.2025, 07:16" or "Updated on: 07.07.2025, 07:16"
-        date_patterns = [
-            r'(\d{1,2}\.\d{1,2}\.\d{4},?\s+\d{1,2}:\d{2})',
-            r'Updated on:\s*(\d{1,2}\.\d{1,2}\.\d{4},?\s+\d{1,2}:\d{2})',
-            r'Aktualisiert am:\s*(\d{1,2}\.\d{1,2}\.\d{4},?\s+\d{1,2}:\d{2})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        for pattern in _DATE_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
                 
         return None
     
+    def _build_pass(self, name: str, pass_url: str, section) -> AlpinePass:
+        """
+        Extract the pass fields from the text of a section.
+        
+        Args:
+            name (str): Name of the pass
+            pass_url (str): URL to detailed pass information
+            section: lxml element containing pass information
+            
+        Returns:
+            AlpinePass: Parsed pass object
+        """
+        # Collect the section text once, one text node per line; every
+        # field is scanned from it. Whitespace inside a node (including line
+        # breaks) is collapsed so a node never spans several lines.
+        texts = (" ".join(text.split()) for text in _TEXT_NODES(section))
+        full_text = "\n".join(text for text in texts if text)
+        
+        # Extract route information
+        match = _ROUTE_RE.search(full_text)
+        route_text = match.group(0) if match else ""
+        
+        # Extract status
+        match = _STATUS_RE.search(full_text)
+        status = match.group(0) if match else "Unknown"
+        
+        # Extract temperature
+        temperature = self._extract_temperature(full_text)
+        
+        # Extract last update
+        last_update = self._extract_update_time(full_text)
+        
+        # Extract notes (winter restrictions, etc.)
+        notes = ""
+        for match in _NOTES_RE.finditer(full_text):
+            text_clean = match.group(0)
+            if len(text_clean) > 20:
+                notes = text_clean[:200] + "..." if len(text_clean) > 200 else text_clean
+                break
+        
+        return AlpinePass(
+            name=name,
+            route=route_text,
+            status=status,
+            temperature=temperature,
+            last_update=last_update,
+            url=pass_url,
+            notes=notes if notes else None
+        )
+    
     def _parse_pass_section(self, section) -> Optional[AlpinePass]:
         """
         Parse a pass section from the HTML to extract pass information.
         
         Args:
-            section: BeautifulSoup element containing pass information
+            section: lxml element containing pass information
             
         Returns:
             Optional[AlpinePass]: Parsed pass object or None if parsing failed
         """
         try:
             # Extract pass name and URL
-            name_link = section.find('a')
-            if not name_link:
+            name_link = section.find('.//a')
+            if name_link is None:
                 return None
                 
-            name = name_link.get_text(strip=True)
+            name = name_link.text_content().strip()
             href = name_link.get('href', '')
-            if href:
-                pass_url = urljoin(self.BASE_URL, href)
+            # Links on the site are absolute or site-relative paths
+            if href.startswith('http'):
+                pass_url = href
+            elif href.startswith('/'):
+                pass_url = self.BASE_URL + href
+            elif href:
+                pass_url = f"{self.BASE_URL}/{href}"
             else:
                 pass_url = ""
             
-            # Extract route information
-            route_text = ""
-            route_elements = section.find_all(string=True)
-            for text in route_elements:
-                text_clean = text.strip()
-                if ' - ' in text_clean and len(text_clean) < 100:
-                    route_text = text_clean
-                    break
-            
-            # Extract status
-            status = "Unknown"
-            status_elements = section.find_all(text=True)
-            for text in status_elements:
-                text_clean = text.strip().lower()
-                if any(keyword in text_clean for keyword in [
-                    'open', 'offen', 'closed', 'gesperrt', 'befahrbar', 'restriction'
-                ]):
-                    status = text.strip()
-                    break
-            
-            # Extract temperature
-            temperature = None
-            temp_elements = section.find_all(text=True)
-            for text in temp_elements:
-                temp = self._extract_temperature(text)
-                if temp is not None:
-                    temperature = temp
-                    break
-            
-            # Extract last update
-            last_update = None
-            update_elements = section.find_all(text=True)
-            for text in update_elements:
-                update = self._extract_update_time(text)
-                if update:
-                    last_update = update
-                    break
-            
-            # Extract notes (winter restrictions, etc.)
-            notes = ""
-            note_texts = section.find_all(text=True)
-            for text in note_texts:
-                text_clean = text.strip()
-                if any(keyword in text_clean.lower() for keyword in [
-                    'winter', 'snow', 'chain', 'restriction', 'obligatory',
-                    'winter', 'schnee', 'ketten', 'einschränkung', 'obligatorisch'
-                ]) and len(text_clean) > 20:
-                    notes = text_clean[:200] + "..." if len(text_clean) > 200 else text_clean
-                    break
-            
-            return AlpinePass(
-                name=name,
-                route=route_text,
-                status=status,
-                temperature=temperature,
-                last_update=last_update,
-                url=pass_url,
-                notes=notes if notes else None
-            )
+            return self._build_pass(name, pass_url, section)
             
         except Exception as e:
             logger.error(f"Error parsing pass section: {e}")
             return None
     
-    def get_all_passes(self) -> List[AlpinePass]:
+    def _parse_main_page(self, content: bytes) -> List[AlpinePass]:
         """
-        Fetch information for all Alpine passes from the main page.
+        Parse all Alpine passes from the main page.
         
+        Args:
+            content (bytes): HTML of the main page
+            
         Returns:
             List[AlpinePass]: List of all available Alpine passes
         """
-        response = self._make_request(self.main_url)
-        if not response:
-            logger.error("Failed to fetch main page")
-            return []
-        
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = html.document_fromstring(content, parser=_HTML_PARSER)
             passes = []
             
             # Look for pass information sections
             # The passes seem to be in sections with links to individual pass pages
-            pass_links = soup.find_all('a', href=True)
+            pass_links = _PASS_LINKS(doc)
             
             processed_names = set()  # Avoid duplicates
+            processed_hrefs = set()  # Passes are often linked more than once
             
             for link in pass_links:
                 href = link.get('href', '')
-                if href and '/alpenpaesse/' in href and href not in processed_names:
-                    # Find the parent section containing this pass
-                    section = link.find_parent()
-                    while section and hasattr(section, 'name') and section.name != 'body':
-                        # Look for temperature and status information in this section
-                        section_text = section.get_text()
-                        if '°C' in section_text and any(keyword in section_text.lower() 
-                                                       for keyword in ['open', 'offen', 'updated', 'aktualisiert']):
-                            pass_info = self._parse_pass_section(section)
-                            if pass_info and pass_info.name not in processed_names:
-                                passes.append(pass_info)
-                                processed_names.add(pass_info.name)
-                                break
-                        section = section.find_parent()
+                if href in processed_hrefs:
+                    continue
+                
+                # Find the parent section containing this pass
+                sections = _PASS_SECTION(link)
+                if not sections:
+                    continue
+                # Remember the pass the section describes (its first link)
+                # rather than this link, which may be a navigation link
+                processed_hrefs.add(sections[0].find('.//a').get('href', ''))
+                
+                pass_info = self._parse_pass_section(sections[0])
+                if pass_info and pass_info.name not in processed_names:
+                    passes.append(pass_info)
+                    processed_names.add(pass_info.name)
             
             logger.info(f"Successfully parsed {len(passes)} passes")
             return passes
@@ -309,6 +386,77 @@ class AlpenPasseScraper:
             logger.error(f"Error parsing main page: {e}")
             return []
     
+    def _get_cached_passes(self) -> Optional[List[AlpinePass]]:
+        """
+        Get the passes of the last main page fetch if still fresh.
+        
+        Returns:
+            Optional[List[AlpinePass]]: Cached passes or None if expired
+        """
+        if self._cached_passes and time.monotonic() - self._cached_passes[0] < self.CACHE_TTL:
+            return self._cached_passes[1]
+        return None
+    
+    def _set_cached_passes(self, passes: List[AlpinePass]) -> None:
+        """
+        Remember the passes of a main page fetch; failed fetches are not cached.
+        
+        Args:
+            passes (List[AlpinePass]): Passes parsed from the main page
+        """
+        if passes:
+            self._cached_passes = (time.monotonic(), passes)
+    
+    def get_all_passes(self) -> List[AlpinePass]:
+        """
+        Fetch information for all Alpine passes from the main page.
+        
+        Returns:
+            List[AlpinePass]: List of all available Alpine passes
+        """
+        with self._lock:
+            passes = self._get_cached_passes()
+            if passes is not None:
+                return passes
+            
+            response = self._make_request(self.main_url)
+            if not response:
+                logger.error("Failed to fetch main page")
+                return []
+            
+            passes = self._parse_main_page(response.content)
+            self._set_cached_passes(passes)
+            return passes
+    
+    async def async_get_all_passes(self, session: aiohttp.ClientSession) -> List[AlpinePass]:
+        """
+        Fetch information for all Alpine passes from the main page without blocking.
+        
+        The page is downloaded on the event loop; parsing runs in the default
+        executor.
+        
+        Args:
+            session (aiohttp.ClientSession): Session to send the request with
+            
+        Returns:
+            List[AlpinePass]: List of all available Alpine passes
+        """
+        async with self._async_lock:
+            passes = self._get_cached_passes()
+            if passes is not None:
+                return passes
+            
+            content = await self._async_make_request(session, self.main_url)
+            if content is None:
+                logger.error("Failed to fetch main page")
+                return []
+            
+            passes = await asyncio.get_running_loop().run_in_executor(
+                None, self._parse_main_page, content
+            )
+            self._set_cached_passes(passes)
+            return passes
+    
     def get_pass_details(self, pass_name: str) -> Optional[AlpinePass]:
         """
         Get detailed information for a specific pass.
@@ -320,11 +468,82 @@ class AlpenPasseScraper:
             Optional[AlpinePass]: Detailed pass information or None if not found
         """
         passes = self.get_all_passes()
+        pass_name = pass_name.lower()
         for pass_info in passes:
-            if pass_name.lower() in pass_info.name.lower():
+            if pass_name in pass_info.name.lower():
                 return pass_info
         return None
     
+    def _parse_pass_page(self, content: bytes, url: str) -> Optional[AlpinePass]:
+        """
+        Parse a single pass from its own page.
+        
+        Args:
+            content (bytes): HTML of the pass page
+            url (str): URL of the pass page
+            
+        Returns:
+            Optional[AlpinePass]: Pass information or None if parsing failed
+        """
+        try:
+            doc = html.document_fromstring(content, parser=_HTML_PARSER)
+            heading = doc.find('.//h1')
+            if heading is None:
+                return None
+            
+            section = doc.find('.//main')
+            if section is None:
+                section = doc.body
+            
+            return self._build_pass(heading.text_content().strip(), url, section)
+            
+        except Exception as e:
+            logger.error(f"Error parsing pass page {url}: {e}")
+            return None
+    
+    def _pass_page_url(self, url_path: str) -> str:
+        """Return the URL of the page of a single pass."""
+        return f"{self.main_url}alpenpaesse/{url_path}"
+    
+    def get_pass_by_path(self, url_path: str) -> Optional[AlpinePass]:
+        """
+        Fetch information for a single pass from its own page.
+        
+        Args:
+            url_path (str): URL path of the pass (e.g., "albulapass")
+            
+        Returns:
+            Optional[AlpinePass]: Pass information or None if not found
+        """
+        url = self._pass_page_url(url_path)
+        response = self._make_request(url)
+        if not response:
+            return None
+        
+        return self._parse_pass_page(response.content, url)
+    
+    async def async_get_pass_by_path(
+        self, session: aiohttp.ClientSession, url_path: str
+    ) -> Optional[AlpinePass]:
+        """
+        Fetch information for a single pass from its own page without blocking.
+        
+        Args:
+            session (aiohttp.ClientSession): Session to send the request with
+            url_path (str): URL path of the pass (e.g., "albulapass")
+            
+        Returns:
+            Optional[AlpinePass]: Pass information or None if not found
+        """
+        url = self._pass_page_url(url_path)
+        content = await self._async_make_request(session, url)
+        if content is None:
+            return None
+        
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._parse_pass_page, content, url
+        )
+    
     def get_open_passes(self) -> List[AlpinePass]:
         """
         Get list of currently open passes.
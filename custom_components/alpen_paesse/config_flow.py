@@ -17,6 +17,22 @@ _LOGGER = logging.getLogger(__name__)
 # Import cv for multi_select at module level
 from homeassistant.helpers import config_validation as cv
 
+# Pass choices and validator shared by every form render
+_PASS_CHOICES = {key: pass_info["name"] for key, pass_info in AVAILABLE_PASSES.items()}
+_PASSES_VALIDATOR = vol.All(cv.multi_select(_PASS_CHOICES), vol.Length(min=1))
+
+
+def _data_schema(language: str, selected_passes: list[str]) -> vol.Schema:
+    """Return the form schema with the given defaults."""
+    return vol.Schema({
+        vol.Required(CONF_LANGUAGE, default=language): vol.In(LANGUAGES),
+        vol.Required(CONF_SELECTED_PASSES, default=selected_passes): _PASSES_VALIDATOR,
+    })
+
+
+# Schema of the initial setup form
+_USER_SCHEMA = _data_schema("de", [])
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     
@@ -53,18 +69,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
 
-        data_schema = vol.Schema({
-            vol.Required(CONF_LANGUAGE, default="de"): vol.In(LANGUAGES),
-            vol.Required(CONF_SELECTED_PASSES, default=[]): 
-                vol.All(cv.multi_select({
-                    key: pass_info["name"] 
-                    for key, pass_info in AVAILABLE_PASSES.items()
-                }), vol.Length(min=1))
-        })
-
         return self.async_show_form(
             step_id="user", 
-            data_schema=data_schema, 
+            data_schema=_USER_SCHEMA, 
             errors=errors
         )
 
@@ -86,19 +93,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 return self.async_abort(reason="unknown")
 
-        data_schema = vol.Schema({
-            vol.Required(
-                CONF_LANGUAGE, 
-                default=config_entry.data.get(CONF_LANGUAGE, "de")
-            ): vol.In(LANGUAGES),
-            vol.Required(
-                CONF_SELECTED_PASSES, 
-                default=config_entry.data.get(CONF_SELECTED_PASSES, [])
-            ): vol.All(cv.multi_select({
-                key: pass_info["name"] 
-                for key, pass_info in AVAILABLE_PASSES.items()
-            }), vol.Length(min=1))
-        })
+        data_schema = _data_schema(
+            config_entry.data.get(CONF_LANGUAGE, "de"),
+            config_entry.data.get(CONF_SELECTED_PASSES, []),
+        )
 
         return self.async_show_form(
             step_id="reconfigure",
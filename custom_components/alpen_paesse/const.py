@@ -132,3 +132,6 @@ LANGUAGES = {
     "de": "Deutsch",
     "en": "English"
 }
+
+# Maximum number of simultaneous requests to the website
+MAX_CONCURRENT_REQUESTS = 3
@@ -3,13 +3,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import AVAILABLE_PASSES, CONF_SELECTED_PASSES, CONF_LANGUAGE, DOMAIN, UPDATE_INTERVAL
+from .const import (
+    AVAILABLE_PASSES,
+    CONF_LANGUAGE,
+    CONF_SELECTED_PASSES,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+    UPDATE_INTERVAL,
+)
 from .alpen_paesse import AlpenPasseScraper
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,71 +34,132 @@ class AlpenPasseCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Pass data is a dict of plain values, so unchanged refreshes
+            # can be detected by comparison and skip notifying the sensors
+            always_update=False,
         )
         self.selected_passes = config.get(CONF_SELECTED_PASSES, [])
         self.language = config.get(CONF_LANGUAGE, "de")
         self.scraper = AlpenPasseScraper(language=self.language)
+        self.session = async_get_clientsession(hass)
+        # Passes whose data changed in the last update; None notifies all
+        self._changed_passes: set[str] | None = None
+        
+        # Index the selected passes by lower-case name so scraped passes can
+        # be matched without scanning all available passes
+        self._name_to_key = {
+            AVAILABLE_PASSES[pass_key]["name"].lower(): pass_key
+            for pass_key in self.selected_passes
+            if pass_key in AVAILABLE_PASSES
+        }
+        self._name_re: re.Pattern[str] | None = None
+        if self._name_to_key:
+            self._name_re = re.compile("|".join(
+                re.escape(name)
+                for name in sorted(self._name_to_key, key=len, reverse=True)
+            ))
+
+    def _match_pass_key(self, name: str) -> str | None:
+        """Return the selected pass key matching a scraped pass name."""
+        name = name.lower()
+        if (pass_key := self._name_to_key.get(name)) is not None:
+            return pass_key
+        
+        # The scraped name may contain the configured name ...
+        if self._name_re is not None and (match := self._name_re.search(name)):
+            return self._name_to_key[match.group(0)]
+        
+        # ... or be a shortened form of it
+        for pass_name, pass_key in self._name_to_key.items():
+            if name in pass_name:
+                return pass_key
+        
+        return None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of the passes whose data changed."""
+        changed_passes = self._changed_passes
+        self._changed_passes = None
+        if changed_passes is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        
+        # Sensors register with their pass key as context
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed_passes:
+                update_callback()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the website using the library."""
+        self._changed_passes = None
         if not self.selected_passes:
             return {}
 
         try:
-            # Run the synchronous scraper in an executor
-            passes_data = await self.hass.async_add_executor_job(
-                self.scraper.get_all_passes
-            )
+            passes_data = await self.scraper.async_get_all_passes(self.session)
             
             # Map passes by name to match our selected passes
             data = {}
             for alpine_pass in passes_data:
-                # Try to match pass names
-                for pass_key, pass_info in AVAILABLE_PASSES.items():
-                    if pass_key in self.selected_passes:
-                        # Match by name (case insensitive)
-                        if (pass_info["name"].lower() in alpine_pass.name.lower() or
-                            alpine_pass.name.lower() in pass_info["name"].lower()):
-                            
-                            data[pass_key] = {
-                                "name": alpine_pass.name,
-                                "status": alpine_pass.status,
-                                "temperature": alpine_pass.temperature,
-                                "last_update": alpine_pass.last_update,
-                                "route": alpine_pass.route,
-                                "notes": alpine_pass.notes,
-                            }
-                            break
+                pass_key = self._match_pass_key(alpine_pass.name)
+                if pass_key is not None:
+                    data[pass_key] = {
+                        "name": alpine_pass.name,
+                        "status": alpine_pass.status,
+                        "temperature": alpine_pass.temperature,
+                        "last_update": alpine_pass.last_update,
+                        "route": alpine_pass.route,
+                        "notes": alpine_pass.notes,
+                    }
             
-            # If we didn't find matches using the main page, try individual pass lookups
-            if len(data) < len(self.selected_passes):
-                missing_passes = [p for p in self.selected_passes if p not in data]
-                for pass_key in missing_passes:
-                    pass_info = AVAILABLE_PASSES[pass_key]
-                    try:
-                        alpine_pass = await self.hass.async_add_executor_job(
-                            self.scraper.get_pass_details, pass_info["name"]
+            # If we didn't find matches using the main page, fetch the pages
+            # of the missing passes concurrently
+            missing_passes = [p for p in self.selected_passes if p not in data]
+            if missing_passes:
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+                async def fetch_pass(pass_key: str):
+                    async with semaphore:
+                        return await self.scraper.async_get_pass_by_path(
+                            self.session, AVAILABLE_PASSES[pass_key]["url_path"]
                         )
-                        if alpine_pass:
-                            data[pass_key] = {
-                                "name": alpine_pass.name,
-                                "status": alpine_pass.status,
-                                "temperature": alpine_pass.temperature,
-                                "last_update": alpine_pass.last_update,
-                                "route": alpine_pass.route,
-                                "notes": alpine_pass.notes,
-                            }
-                    except Exception as err:
+
+                results = await asyncio.gather(
+                    *(fetch_pass(pass_key) for pass_key in missing_passes),
+                    return_exceptions=True,
+                )
+                for pass_key, alpine_pass in zip(missing_passes, results):
+                    if isinstance(alpine_pass, Exception):
                         _LOGGER.warning(
                             "Failed to fetch individual pass %s: %s", 
-                            pass_info["name"], 
-                            err
+                            AVAILABLE_PASSES[pass_key]["name"], 
+                            alpine_pass
                         )
+                    elif alpine_pass:
+                        data[pass_key] = {
+                            "name": alpine_pass.name,
+                            "status": alpine_pass.status,
+                            "temperature": alpine_pass.temperature,
+                            "last_update": alpine_pass.last_update,
+                            "route": alpine_pass.route,
+                            "notes": alpine_pass.notes,
+                        }
             
             if not data:
                 raise UpdateFailed("No data retrieved from any passes")
             
             _LOGGER.debug("Successfully fetched data for %d passes", len(data))
+            
+            # After a failed update every entity has to become available
+            # again; otherwise only the passes whose data changed are notified
+            if self.last_update_success and self.data is not None:
+                self._changed_passes = {
+                    pass_key
+                    for pass_key in data.keys() | self.data.keys()
+                    if data.get(pass_key) != self.data.get(pass_key)
+                }
+            
             return data
             
         except Exception as err:
@@ -1,6 +1,8 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
+from abc import abstractmethod
+from collections.abc import Iterator
 import logging
 # Remove datetime import since we're using string timestamps
 from typing import Any
@@ -12,7 +14,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -29,150 +31,165 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator: AlpenPasseCoordinator = hass.data[DOMAIN][entry.entry_id]
     
-    entities = []
-    
+    # The coordinator has already fetched the data during entry setup
+    async_add_entities(_iter_sensors(coordinator), update_before_add=False)
+
+
+def _iter_sensors(coordinator: AlpenPasseCoordinator) -> Iterator[AlpenPassSensorBase]:
+    """Yield the sensors of the selected passes."""
     for pass_key in coordinator.selected_passes:
-        if pass_key in AVAILABLE_PASSES:
-            pass_info = AVAILABLE_PASSES[pass_key]
-            
-            # Create three sensors for each pass
-            entities.extend([
-                AlpenPassStatusSensor(coordinator, pass_key, pass_info),
-                AlpenPassTemperatureSensor(coordinator, pass_key, pass_info),
-                AlpenPassLastUpdateSensor(coordinator, pass_key, pass_info),
-            ])
-    
-    async_add_entities(entities, update_before_add=True)
+        pass_info = AVAILABLE_PASSES.get(pass_key)
+        if pass_info is None:
+            continue
+        
+        # The three sensors of a pass share one device info and one
+        # attributes dict
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, pass_key)},
+            name=pass_info["name"],
+            manufacturer="alpen-paesse.ch",
+            model="Swiss Alpine Pass",
+            suggested_area="Alps",
+        )
+        attributes = {"route": pass_info["route"], "pass_key": pass_key}
+        for sensor_class in (
+            AlpenPassStatusSensor,
+            AlpenPassTemperatureSensor,
+            AlpenPassLastUpdateSensor,
+        ):
+            yield sensor_class(coordinator, pass_key, pass_info, device_info, attributes)
 
 
 class AlpenPassSensorBase(CoordinatorEntity[AlpenPasseCoordinator], SensorEntity):
     """Base class for Alpen-Paesse sensors."""
     
+    _attr_has_entity_name = True
+    
     def __init__(
         self, 
         coordinator: AlpenPasseCoordinator, 
         pass_key: str, 
-        pass_info: dict[str, Any]
+        pass_info: dict[str, Any],
+        device_info: DeviceInfo,
+        attributes: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        # Register the listener with the pass as context so the coordinator
+        # can tell which pass an entity belongs to
+        super().__init__(coordinator, context=pass_key)
         self.pass_key = pass_key
         self.pass_info = pass_info
+        self.static_attributes = attributes
         
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.pass_key)},
-            name=self.pass_info["name"],
-            manufacturer="alpen-paesse.ch",
-            model="Swiss Alpine Pass",
-            suggested_area="Alps",
-        )
+        # Device and attributes are fixed for the lifetime of the entity and
+        # shared with the other sensors of the pass
+        self._attr_device_info = device_info
+        self._attr_extra_state_attributes = attributes
+        self._update_from_coordinator()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success 
-            and self.pass_key in self.coordinator.data
-        )
+        # CoordinatorEntity overrides available; use the value computed on
+        # the last coordinator update instead
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Update availability and value from the coordinator data."""
+        entry = self.coordinator.data.get(self.pass_key)
+        self._attr_available = self.coordinator.last_update_success and entry is not None
+        self._update_from_entry(entry)
+
+    @abstractmethod
+    def _update_from_entry(self, entry: dict[str, Any] | None) -> None:
+        """Update the sensor value from the data of its pass."""
 
 
 class AlpenPassStatusSensor(AlpenPassSensorBase):
     """Representation of an Alpine Pass Status Sensor."""
     
+    _attr_name = "Status"
+    
     def __init__(
         self, 
         coordinator: AlpenPasseCoordinator, 
         pass_key: str, 
-        pass_info: dict[str, Any]
+        pass_info: dict[str, Any],
+        device_info: DeviceInfo,
+        attributes: dict[str, Any],
     ) -> None:
         """Initialize the status sensor."""
-        super().__init__(coordinator, pass_key, pass_info)
-        self._attr_name = f"{pass_info['name']} Status"
+        super().__init__(coordinator, pass_key, pass_info, device_info, attributes)
         self._attr_unique_id = f"{pass_key}_status"
         self._attr_icon = "mdi:road"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the native value of the sensor."""
-        if self.pass_key not in self.coordinator.data:
-            return None
-        return self.coordinator.data[self.pass_key].get("status")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        return {
-            "route": self.pass_info["route"],
-            "pass_key": self.pass_key,
+    def _update_from_entry(self, entry: dict[str, Any] | None) -> None:
+        """Update the status from the data of its pass."""
+        entry = entry or {}
+        self._attr_native_value = entry.get("status")
+        # Carry the other readings as attributes so a single entity per pass
+        # covers them; the dedicated sensors are disabled by default
+        self._attr_extra_state_attributes = {
+            **self.static_attributes,
+            "temperature": entry.get("temperature"),
+            "last_update": entry.get("last_update"),
         }
 
 
 class AlpenPassTemperatureSensor(AlpenPassSensorBase):
     """Representation of an Alpine Pass Temperature Sensor."""
     
+    _attr_name = "Temperature"
+    _attr_entity_registry_enabled_default = False
+    
     def __init__(
         self, 
         coordinator: AlpenPasseCoordinator, 
         pass_key: str, 
-        pass_info: dict[str, Any]
+        pass_info: dict[str, Any],
+        device_info: DeviceInfo,
+        attributes: dict[str, Any],
     ) -> None:
         """Initialize the temperature sensor."""
-        super().__init__(coordinator, pass_key, pass_info)
-        self._attr_name = f"{pass_info['name']} Temperature"
+        super().__init__(coordinator, pass_key, pass_info, device_info, attributes)
         self._attr_unique_id = f"{pass_key}_temperature"
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:thermometer"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the native value of the sensor."""
-        if self.pass_key not in self.coordinator.data:
-            return None
-        return self.coordinator.data[self.pass_key].get("temperature")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        return {
-            "route": self.pass_info["route"],
-            "pass_key": self.pass_key,
-        }
+    def _update_from_entry(self, entry: dict[str, Any] | None) -> None:
+        """Update the temperature from the data of its pass."""
+        self._attr_native_value = entry.get("temperature") if entry else None
 
 
 class AlpenPassLastUpdateSensor(AlpenPassSensorBase):
     """Representation of an Alpine Pass Last Update Sensor."""
     
+    _attr_name = "Last Update"
+    _attr_entity_registry_enabled_default = False
+    
     def __init__(
         self, 
         coordinator: AlpenPasseCoordinator, 
         pass_key: str, 
-        pass_info: dict[str, Any]
+        pass_info: dict[str, Any],
+        device_info: DeviceInfo,
+        attributes: dict[str, Any],
     ) -> None:
         """Initialize the last update sensor."""
-        super().__init__(coordinator, pass_key, pass_info)
-        self._attr_name = f"{pass_info['name']} Last Update"
+        super().__init__(coordinator, pass_key, pass_info, device_info, attributes)
         self._attr_unique_id = f"{pass_key}_last_update"
         # Remove timestamp device class since we're using raw string
         self._attr_icon = "mdi:clock-check-outline"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the native value of the sensor."""
-        if self.pass_key not in self.coordinator.data:
-            return None
-        
-        # Return the raw timestamp string as provided by the website
-        return self.coordinator.data[self.pass_key].get("last_update")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        return {
-            "route": self.pass_info["route"],
-            "pass_key": self.pass_key,
-        }
+    def _update_from_entry(self, entry: dict[str, Any] | None) -> None:
+        """Update the last update time from the data of its pass."""
+        # Keep the raw timestamp string as provided by the website
+        self._attr_native_value = entry.get("last_update") if entry else None